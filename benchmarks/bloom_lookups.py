@@ -0,0 +1,65 @@
+"""Lookup time with and without a BloomFilter, for hits and misses, on an
+in-memory list, a MappedSortedArray and a LinkedList.
+
+Run from the repository root: python -m benchmarks.bloom_lookups
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from structures.algorithms import binary_search
+from structures.models import BloomFilter, MappedSortedArray, SimpleLinkedList, dump_sorted
+
+SIZE = 1_000_000
+LOOKUPS = 100_000
+LIST_SIZE = 2_000
+LIST_LOOKUPS = 2_000
+
+
+def timed(lookup, targets) -> float:
+    start = time.perf_counter()
+    for target in targets:
+        lookup(target)
+    return time.perf_counter() - start
+
+
+def report(name, plain, filtered, hits, misses) -> None:
+    for kind, targets in (("miss", misses), ("hit", hits)):
+        before = timed(plain, targets)
+        after = timed(filtered, targets)
+        print(f"{name:<18} {kind:<4} {before:7.3f}s -> {after:7.3f}s  ({before / after:4.1f}x)")
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    values = list(range(0, 2 * SIZE, 2))
+    bloom = BloomFilter.from_iterable(values)
+    hits = [rng.randrange(SIZE) * 2 for _ in range(LOOKUPS)]
+    misses = [rng.randrange(SIZE) * 2 + 1 for _ in range(LOOKUPS)]
+    print(f"{SIZE} sorted ints, {LOOKUPS} lookups, filter {bloom.nbytes / 1024:.0f} KiB")
+
+    report("list",
+           lambda t: binary_search(values, t),
+           lambda t: binary_search(values, t, bloom),
+           hits, misses)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "table.bin")
+        dump_sorted(values, path)
+        with MappedSortedArray(path) as mapped:
+            report("MappedSortedArray",
+                   lambda t: binary_search(mapped, t),
+                   lambda t: binary_search(mapped, t, bloom),
+                   hits, misses)
+
+    linked = SimpleLinkedList.from_iterable(range(0, 2 * LIST_SIZE, 2))
+    filtered = SimpleLinkedList.from_iterable(range(0, 2 * LIST_SIZE, 2))
+    filtered.attach_filter()
+    print(f"{LIST_SIZE}-node linked list, {LIST_LOOKUPS} finds")
+    report("LinkedList.find",
+           linked.find,
+           filtered.find,
+           [rng.randrange(LIST_SIZE) * 2 for _ in range(LIST_LOOKUPS)],
+           [rng.randrange(LIST_SIZE) * 2 + 1 for _ in range(LIST_LOOKUPS)])
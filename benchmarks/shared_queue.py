@@ -0,0 +1,61 @@
+"""Compare SharedRingQueue with multiprocessing.Queue for streaming ints
+from one worker process to the parent.
+
+Run from the repository root: python -m benchmarks.shared_queue
+"""
+
+import multiprocessing
+import time
+
+from structures.models import SharedRingQueue
+
+ITEMS = 200_000
+BATCH = 256
+
+
+def produce_mp(queue, count: int) -> None:
+    for i in range(count):
+        queue.put(i)
+
+
+def produce_ring(queue: SharedRingQueue, count: int) -> None:
+    i = 0
+    while i < count:
+        added = queue.enqueue_many(range(i, min(i + BATCH, count)))
+        if not added:
+            time.sleep(0)
+        i += added
+
+
+def bench_mp_queue() -> float:
+    queue = multiprocessing.Queue()
+    worker = multiprocessing.Process(target=produce_mp, args=(queue, ITEMS))
+    start = time.perf_counter()
+    worker.start()
+    for _ in range(ITEMS):
+        queue.get()
+    elapsed = time.perf_counter() - start
+    worker.join()
+    return elapsed
+
+
+def bench_ring_queue() -> float:
+    queue = SharedRingQueue(4096)
+    worker = multiprocessing.Process(target=produce_ring, args=(queue, ITEMS))
+    start = time.perf_counter()
+    worker.start()
+    received = 0
+    while received < ITEMS:
+        queue.wait()
+        received += len(queue.dequeue_many(BATCH))
+    elapsed = time.perf_counter() - start
+    worker.join()
+    queue.close()
+    queue.unlink()
+    return elapsed
+
+
+if __name__ == "__main__":
+    print(f"{ITEMS} ints, one producer process")
+    print(f"multiprocessing.Queue: {bench_mp_queue():.3f}s")
+    print(f"SharedRingQueue:       {bench_ring_queue():.3f}s")
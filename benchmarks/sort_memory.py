@@ -0,0 +1,33 @@
+"""Peak memory (tracemalloc) and time of the list-returning sorts.
+
+Run from the repository root: python -m benchmarks.sort_memory
+"""
+
+import random
+import time
+import tracemalloc
+
+from structures.algorithms import mergesort, quicksort
+
+SIZE = 100_000
+
+
+def measure(sort, data):
+    start = time.perf_counter()
+    sort(data)
+    elapsed = time.perf_counter() - start
+    # Timed separately: tracing slows allocation-heavy code down.
+    tracemalloc.start()
+    sort(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+if __name__ == "__main__":
+    data = [random.randrange(SIZE) for _ in range(SIZE)]
+    print(f"{SIZE} ints, output list is {8 * SIZE / 1024:.0f} KiB of pointers")
+    for label, values in (("random", data), ("sorted", sorted(data))):
+        for sort in (mergesort, quicksort):
+            peak, elapsed = measure(sort, values)
+            print(f"{label:<7} {sort.__name__:<10} peak {peak / 1024:8.0f} KiB  {elapsed:.3f}s")
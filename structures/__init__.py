@@ -1,21 +1,46 @@
 """Simple package exposing data structures and algorithms for the challenge."""
 
-from .models import Stack, Queue, LinkedList
+from .models import (
+    Stack,
+    Queue,
+    MonotonicQueue,
+    SlidingWindow,
+    SharedRingQueue,
+    LinkedList,
+    MappedSortedArray,
+    dump_sorted,
+    BloomFilter,
+)
 from .algorithms import (
     binary_search,
+    binary_search_many,
     quicksort,
     mergesort,
+    merge_into_sorted,
+    remove_from_sorted,
     factorial_recursive,
     fibonacci_recursive,
 )
+from .dispatch import sort, search
 
 __all__ = [
     "Stack",
     "Queue",
+    "MonotonicQueue",
+    "SlidingWindow",
+    "SharedRingQueue",
     "LinkedList",
+    "MappedSortedArray",
+    "dump_sorted",
+    "BloomFilter",
     "binary_search",
+    "binary_search_many",
     "quicksort",
     "mergesort",
+    "merge_into_sorted",
+    "remove_from_sorted",
     "factorial_recursive",
     "fibonacci_recursive",
+    "sort",
+    "search",
 ]
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-from typing import List, Sequence, Optional
+from bisect import bisect_left, bisect_right
+from typing import Container, Iterable, List, Sequence, Optional
 
 
-def binary_search(sorted_list: Sequence[int], target: int) -> int:
+def binary_search(
+        sorted_list: Sequence[int],
+        target: int,
+        membership: Optional[Container[int]] = None) -> int:
     """
     Perform binary search on a sorted sequence of integers.
     Returns the index of target, or -1 if not found.
+    membership (e.g. a BloomFilter built from sorted_list) answers
+    definite misses before searching. Checking it adds to the cost of hits,
+    so only pass one when most lookups are expected to miss.
     Time Complexity: O(log n)
     Space Complexity: O(1)
     """
+    if membership is not None and target not in membership:
+        return -1
     lo = 0
     hi = len(sorted_list) - 1
     while lo <= hi:
@@ -49,21 +58,79 @@ def binary_search_recursive(
         return binary_search_recursive(sorted_list, target, lo, mid - 1)
 
 
+def binary_search_many(
+        sorted_list: Sequence[int],
+        targets: Iterable[int],
+        membership: Optional[Container[int]] = None) -> List[int]:
+    """
+    Look up every target in a sorted sequence of integers.
+    Returns the index of each target (or -1) in the order targets were given.
+    Targets are probed in ascending order so each search starts where the
+    previous one ended, keeping accesses to large (e.g. memory-mapped)
+    sequences moving forward. Targets ruled out by membership are skipped.
+    Time Complexity: O(k log k + k log n)
+    Space Complexity: O(k)
+    """
+    targets = list(targets)
+    results = [-1] * len(targets)
+    lo = 0
+    n = len(sorted_list)
+    candidates = range(len(targets))
+    if membership is not None:
+        candidates = [i for i in candidates if targets[i] in membership]
+    for position in sorted(candidates, key=targets.__getitem__):
+        target = targets[position]
+        hi = n - 1
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            if sorted_list[mid] < target:
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        if lo < n and sorted_list[lo] == target:
+            results[position] = lo
+    return results
+
+
 def quicksort(unsorted_list: Sequence[int]) -> List[int]:
     """
     Return a new sorted list using quicksort.
+    The input is copied once and partitioned in place over index ranges.
     Time Complexity: Average O(n log n), Worst-case O(n²)
-    Space Complexity: Average O(log n), Worst-case (this) O(n)
+    Space Complexity: O(n) for the copy, O(log n) recursion
     """
-    list_lenght = len(unsorted_list)
-    if list_lenght <= 1:
-        return list(unsorted_list)
-    pivot = unsorted_list[list_lenght // 2]
-    left = [x for x in unsorted_list if x < pivot]
-    middle = [x for x in unsorted_list if x == pivot]
-    right = [x for x in unsorted_list if x > pivot]
-    return quicksort(left) + middle + quicksort(right)
+    result = list(unsorted_list)
+    _quicksort_range(result, 0, len(result) - 1)
+    return result
+
 
+def _quicksort_range(arr: List[int], lo: int, hi: int) -> None:
+    """
+    Sort arr[lo:hi + 1] in place around a middle pivot, grouping values
+    equal to it (three-way partition). Recurses into the smaller side and
+    loops on the larger one, so recursion depth stays O(log n).
+    """
+    while lo < hi:
+        pivot = arr[(lo + hi) // 2]
+        # arr[lo:lt] < pivot, arr[lt:i] == pivot, arr[gt + 1:hi + 1] > pivot
+        lt, i, gt = lo, lo, hi
+        while i <= gt:
+            val = arr[i]
+            if val < pivot:
+                arr[lt], arr[i] = val, arr[lt]
+                lt += 1
+                i += 1
+            elif val > pivot:
+                arr[gt], arr[i] = val, arr[gt]
+                gt -= 1
+            else:
+                i += 1
+        if lt - lo < hi - gt:
+            _quicksort_range(arr, lo, lt - 1)
+            lo = gt + 1
+        else:
+            _quicksort_range(arr, gt + 1, hi)
+            hi = lt - 1
 
 
 def quicksort_in_place(arr: List[int]) -> None:
@@ -94,32 +161,51 @@ def quicksort_in_place(arr: List[int]) -> None:
 def mergesort(unsorted_list: Sequence[int]) -> List[int]:
     """
     Return a new sorted list using mergesort.
+    The input is copied once and a second copy serves as the merge buffer;
+    recursion works on index ranges and swaps the two lists' roles at each
+    level, and merges copy element by element, so no other list is built.
     Time Complexity: Average O(n log n)
     Space Complexity: O(n)
     """
-    list_lenght = len(unsorted_list)
-    if list_lenght <= 1:
-        return list(unsorted_list)
+    result = list(unsorted_list)
+    buffer = result[:]
+    _mergesort_range(buffer, result, 0, len(result))
+    return result
 
-    mid = list_lenght // 2
-    left = mergesort(unsorted_list[:mid])
-    right = mergesort(unsorted_list[mid:])
 
-    # merge
-    i = j = 0
-    merged: List[int] = []
-    while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            merged.append(left[i])
+def _mergesort_range(src: List[int], dst: List[int], lo: int, hi: int) -> None:
+    """
+    Sort dst[lo:hi], given that src[lo:hi] holds the same values. Each half
+    is sorted into src (using dst as scratch) and then merged back into dst.
+    """
+    if hi - lo <= 1:
+        return
+    mid = (lo + hi) // 2
+    _mergesort_range(dst, src, lo, mid)
+    _mergesort_range(dst, src, mid, hi)
+
+    # merge; copies use index loops because slices would build temporary lists
+    if src[mid - 1] <= src[mid]:
+        for k in range(lo, hi):
+            dst[k] = src[k]
+        return
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if src[i] <= src[j]:
+            dst[k] = src[i]
             i += 1
         else:
-            merged.append(right[j])
+            dst[k] = src[j]
             j += 1
-    if i < len(left):
-        merged.extend(left[i:])
-    if j < len(right):
-        merged.extend(right[j:])
-    return merged
+        k += 1
+    while i < mid:
+        dst[k] = src[i]
+        i += 1
+        k += 1
+    while j < hi:
+        dst[k] = src[j]
+        j += 1
+        k += 1
 
 
 def mergesort_in_place(arr: List[int]) -> None:
@@ -159,6 +245,105 @@ def mergesort_in_place(arr: List[int]) -> None:
         size *= 2
 
 
+def _gallop(sorted_list: Sequence[int], target: int, lo: int, right: bool) -> int:
+    """
+    Return the insertion point of target in sorted_list[lo:], probing
+    lo + 1, lo + 3, lo + 7, ... before bisecting the bracketed range.
+    right=True places target after equal values, otherwise before them.
+    Time Complexity: O(log d), d = distance from lo to the insertion point
+    Space Complexity: O(1)
+    """
+    n = len(sorted_list)
+    step = 1
+    hi = lo
+    while hi < n and (sorted_list[hi] <= target if right else sorted_list[hi] < target):
+        lo = hi + 1
+        hi += step
+        step *= 2
+    hi = min(hi, n)
+    if right:
+        return bisect_right(sorted_list, target, lo, hi)
+    return bisect_left(sorted_list, target, lo, hi)
+
+
+def merge_into_sorted(
+        sorted_base: List[int],
+        new_items: Iterable[int],
+        in_place: bool = True) -> List[int]:
+    """
+    Merge new_items into an already sorted list and return the result.
+    Only the delta is sorted (with mergesort); its insertion points are found
+    by galloping through the base and each run of new items is spliced in
+    with a single slice move. With in_place=False the base is left untouched.
+    New items are placed after equal values already in the base.
+    Time Complexity: O(k log k + k log n) comparisons, O(n) element moves
+    Space Complexity: O(k) (plus O(n) for the copy when in_place=False)
+    """
+    delta = mergesort(list(new_items))
+    merged = sorted_base if in_place else list(sorted_base)
+    if not delta:
+        return merged
+
+    positions: List[int] = []
+    lo = 0
+    for value in delta:
+        lo = _gallop(merged, value, lo, right=True)
+        positions.append(lo)
+
+    # Grow once, then fill from the back so every base element moves once.
+    end = len(merged)
+    merged.extend(delta)
+    j = len(delta)
+    while j > 0:
+        pos = positions[j - 1]
+        i = j - 1
+        while i > 0 and positions[i - 1] == pos:
+            i -= 1
+        merged[pos + j:end + j] = merged[pos:end]
+        merged[pos + i:pos + j] = delta[i:j]
+        end = pos
+        j = i
+    return merged
+
+
+def remove_from_sorted(
+        sorted_base: List[int],
+        items: Iterable[int],
+        in_place: bool = True) -> List[int]:
+    """
+    Remove one occurrence of each of items from a sorted list in one pass and
+    return the result. Items that are not present are ignored. With
+    in_place=False the base is left untouched.
+    Time Complexity: O(k log k + k log n) comparisons, O(n) element moves
+    Space Complexity: O(k) (plus O(n) for the copy when in_place=False)
+    """
+    delta = mergesort(list(items))
+    remaining = sorted_base if in_place else list(sorted_base)
+
+    doomed: List[int] = []
+    lo = 0
+    n = len(remaining)
+    for value in delta:
+        lo = _gallop(remaining, value, lo, right=False)
+        if lo == n:
+            break
+        if remaining[lo] == value:
+            doomed.append(lo)
+            lo += 1
+    if not doomed:
+        return remaining
+
+    # Shift each surviving run left over the removed slots.
+    write = doomed[0]
+    for index, pos in enumerate(doomed):
+        next_pos = doomed[index + 1] if index + 1 < len(doomed) else n
+        run = next_pos - pos - 1
+        remaining[write:write + run] = remaining[pos + 1:next_pos]
+        write += run
+    del remaining[write:]
+    return remaining
+
+
 def factorial_recursive(n: int) -> int:
     """
     Compute factorial recursively. Raises ValueError for negative inputs.
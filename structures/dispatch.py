@@ -0,0 +1,129 @@
+"""
+Front doors that pick the fastest algorithm variant for the input size.
+
+sort() and search() read the profile written by ``python -m structures.tune``
+the first time they are called, falling back to DEFAULT_PROFILE.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .algorithms import (
+    binary_search,
+    binary_search_recursive,
+    mergesort,
+    mergesort_in_place,
+    quicksort,
+    quicksort_in_place,
+)
+
+Profile = Dict[str, List[List]]
+
+# Used until a profile is written: [largest size, variant] rows, ascending.
+DEFAULT_PROFILE: Profile = {
+    "sort": [[8, "quicksort_in_place"], [4096, "mergesort_in_place"]],
+    "search": [[4096, "binary_search"]],
+}
+
+
+def _copy_then(
+        sort_in_place: Callable[[List[int]], None]
+) -> Callable[[Sequence[int]], List[int]]:
+    def run(values: Sequence[int]) -> List[int]:
+        result = list(values)
+        sort_in_place(result)
+        return result
+    return run
+
+
+SORTS: Dict[str, Callable[[Sequence[int]], List[int]]] = {
+    "quicksort": quicksort,
+    "quicksort_in_place": _copy_then(quicksort_in_place),
+    "mergesort": mergesort,
+    "mergesort_in_place": _copy_then(mergesort_in_place),
+}
+
+SEARCHES: Dict[str, Callable[[Sequence[int], int], int]] = {
+    "binary_search": binary_search,
+    "binary_search_recursive": binary_search_recursive,
+}
+
+_profile: Optional[Profile] = None
+
+
+def profile_path() -> str:
+    """
+    Location of the profile: $STRUCTURES_PROFILE if set, otherwise
+    structures/profile.json in the user cache directory.
+    """
+    override = os.environ.get("STRUCTURES_PROFILE")
+    if override:
+        return override
+    if os.name == "nt":
+        cache = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    else:
+        cache = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache, "structures", "profile.json")
+
+
+def load_profile(path: Optional[str] = None) -> Profile:
+    """Read a profile, falling back to DEFAULT_PROFILE if missing or invalid."""
+    try:
+        with open(path or profile_path()) as f:
+            profile = json.load(f)
+    except (OSError, ValueError):
+        return DEFAULT_PROFILE
+    if not isinstance(profile, dict):
+        return DEFAULT_PROFILE
+    for kind, variants in (("sort", SORTS), ("search", SEARCHES)):
+        if not _valid_rows(profile.get(kind), variants):
+            return DEFAULT_PROFILE
+    return profile
+
+
+def _valid_rows(rows, variants: Dict[str, Callable]) -> bool:
+    """True for a non-empty list of [size, variant] rows with ascending sizes."""
+    if not isinstance(rows, list) or not rows:
+        return False
+    previous = None
+    for row in rows:
+        if not (isinstance(row, list) and len(row) == 2):
+            return False
+        size, name = row
+        if type(size) is not int or not isinstance(name, str) or name not in variants:
+            return False
+        if previous is not None and size <= previous:
+            return False
+        previous = size
+    return True
+
+
+def _choose(rows: List[List], size: int) -> str:
+    for max_size, name in rows:
+        if size <= max_size:
+            return name
+    return rows[-1][1]
+
+
+def _get_profile() -> Profile:
+    global _profile
+    if _profile is None:
+        _profile = load_profile()
+    return _profile
+
+
+def sort(values: Sequence[int]) -> List[int]:
+    """Return a new sorted list, using the variant tuned for len(values)."""
+    return SORTS[_choose(_get_profile()["sort"], len(values))](values)
+
+
+def search(sorted_list: Sequence[int], target: int) -> int:
+    """
+    Return the index of target in sorted_list, or -1 if not found, using the
+    variant tuned for len(sorted_list).
+    """
+    variant = _choose(_get_profile()["search"], len(sorted_list))
+    return SEARCHES[variant](sorted_list, target)
@@ -1,10 +1,37 @@
 from __future__ import annotations
 
+import math
+import mmap
+import multiprocessing
+import os
+import statistics
+import struct
+import tempfile
+import time
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import deque
-from typing import Generic, Iterator, Optional, TypeVar
+from hashlib import blake2b
+from itertools import islice
+from multiprocessing import shared_memory
+from typing import (
+    Callable,
+    Hashable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 T = TypeVar("T")
+L = TypeVar("L", bound="LinkedList")
 
 
 class Stack(Generic[T]):
@@ -69,6 +96,440 @@ class Queue(Generic[T]):
         return len(self._data)
 
 
+class MonotonicQueue(Queue[T]):
+    """
+    FIFO queue that also tracks its largest (mode="max") or smallest
+    (mode="min") item. A second deque keeps (sequence number, item)
+    candidates in monotonic order, so the extreme is always at its front.
+    Candidates leave by sequence number, not by comparing items, so values
+    that are not equal to themselves (NaN) still leave on time.
+    """
+
+    def __init__(self, mode: str = "max") -> None:
+        super().__init__()
+        if mode not in ("max", "min"):
+            raise ValueError("mode must be 'max' or 'min'")
+        self.mode = mode
+        self._candidates: deque[Tuple[int, T]] = deque()
+        self._enqueued = 0
+        self._dequeued = 0
+
+    def enqueue(self, item: T) -> None:
+        """Add item to the end of the queue. Amortized O(1)."""
+        super().enqueue(item)
+        candidates = self._candidates
+        if self.mode == "max":
+            while candidates and candidates[-1][1] < item:
+                candidates.pop()
+        else:
+            while candidates and candidates[-1][1] > item:
+                candidates.pop()
+        candidates.append((self._enqueued, item))
+        self._enqueued += 1
+
+    def dequeue(self) -> T:
+        """Remove and return the front item. Raises IndexError if empty. O(1)"""
+        item = super().dequeue()
+        if self._candidates[0][0] == self._dequeued:
+            self._candidates.popleft()
+        self._dequeued += 1
+        return item
+
+    def extreme(self) -> Optional[T]:
+        """Return the largest (or smallest) item, or None if empty. O(1)"""
+        if not self._candidates:
+            return None
+        return self._candidates[0][1]
+
+
+def _is_finite(value) -> bool:
+    # Unlike math.isfinite, also works for ints too large for a float.
+    return value - value == 0
+
+
+class SlidingWindow:
+    """
+    Aggregate (min, max, sum or mean) over the last size pushed values.
+    agg is one of min, max, sum or statistics.mean, or its name.
+    min/max use a MonotonicQueue, sum/mean a Queue plus a compensated
+    running total.
+    """
+
+    _AGGREGATES = {min: "min", max: "max", sum: "sum", statistics.mean: "mean"}
+
+    def __init__(self, size: int, agg: Union[str, Callable] = "mean") -> None:
+        if size <= 0:
+            raise ValueError("size must be positive")
+        agg = self._AGGREGATES.get(agg, agg)
+        if agg not in ("min", "max", "sum", "mean"):
+            raise ValueError("agg must be one of min, max, sum or mean")
+        self.size = size
+        self.agg = agg
+        self._tracks_total = agg in ("sum", "mean")
+        self.clear()
+
+    def push(self, value) -> None:
+        """Add value, evicting the oldest one once the window is full. Amortized O(1)."""
+        window = self._window
+        window.enqueue(value)
+        if self._tracks_total:
+            self._add(value)
+        if len(window) > self.size:
+            evicted = window.dequeue()
+            if self._tracks_total:
+                if _is_finite(evicted):
+                    self._add(-evicted)
+                else:
+                    # inf - inf is nan: rebuild the total from the window instead.
+                    self._recompute_total()
+
+    def _add(self, value) -> None:
+        """
+        Neumaier compensated summation: the low-order bits lost when adding
+        value to the running total are kept in _compensation, so adding and
+        later subtracting a large value does not wipe out small ones.
+        """
+        total = self._total + value
+        if abs(self._total) >= abs(value):
+            self._compensation += (self._total - total) + value
+        else:
+            self._compensation += (value - total) + self._total
+        self._total = total
+
+    def _recompute_total(self) -> None:
+        """O(size)"""
+        self._total = 0
+        self._compensation = 0
+        for value in self._window._data:
+            self._add(value)
+
+    def push_many(self, values: Iterable) -> None:
+        """
+        Push every value in order. Values that would be evicted within the
+        batch are skipped, so a batch costs O(min(k, size)) pushes after
+        the O(k) copy.
+        """
+        values = list(values)
+        if len(values) >= self.size:
+            self.clear()
+            values = values[-self.size:]
+        for value in values:
+            self.push(value)
+
+    def value(self):
+        """Return the aggregate of the current window, or None if empty. O(1)"""
+        window = self._window
+        if window.is_empty():
+            return None
+        if self._tracks_total:
+            total = self._total
+            if _is_finite(total):
+                total += self._compensation
+            return total if self.agg == "sum" else total / len(window)
+        return window.extreme()
+
+    def slide(self, values: Iterable) -> Iterator:
+        """Push values one by one, yielding the aggregate of each full window."""
+        for value in values:
+            self.push(value)
+            if len(self._window) == self.size:
+                yield self.value()
+
+    def clear(self) -> None:
+        """Empty the window. O(1)"""
+        self._window: Queue = Queue() if self._tracks_total else MonotonicQueue(self.agg)
+        self._total = 0
+        self._compensation = 0
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+
+class SharedRingQueue:
+    """
+    FIFO queue of fixed-size records living in shared memory, so worker
+    processes exchange items without pickling them through a pipe.
+    Records are packed with a struct format: "q" or "d" for numbers,
+    "16s" for 16-byte strings, etc. Capacity is fixed.
+
+    The head and tail counters are each written by one side only, which
+    keeps single-producer/single-consumer use lock free. With
+    multi_producer=True producers serialize on a lock, created from
+    context (a multiprocessing context) when given. Only one process may
+    consume. Pass the queue to workers as a Process argument; the
+    creating process should unlink() it when done.
+    """
+
+    _HEAD = 0
+    _TAIL = 64  # own cache line, away from _HEAD
+    _HEADER_SIZE = 128
+
+    def __init__(self,
+                 capacity: int,
+                 format: str = "q",
+                 multi_producer: bool = False,
+                 context=None) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.format = format
+        self._record = struct.Struct(format)
+        # The producer lock must come from the context that starts the workers.
+        self._lock = (context or multiprocessing).Lock() if multi_producer else None
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=self._HEADER_SIZE + capacity * self._record.size)
+        self._buf = self._shm.buf
+        struct.pack_into("Q", self._buf, self._HEAD, 0)
+        struct.pack_into("Q", self._buf, self._TAIL, 0)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def __getstate__(self):
+        return (self._shm.name, self.capacity, self.format, self._lock)
+
+    def __setstate__(self, state) -> None:
+        name, self.capacity, self.format, self._lock = state
+        self._record = struct.Struct(self.format)
+        self._shm = shared_memory.SharedMemory(name=name)
+        self._buf = self._shm.buf
+
+    def _load(self, offset: int) -> int:
+        return struct.unpack_from("Q", self._buf, offset)[0]
+
+    def _store(self, offset: int, value: int) -> None:
+        struct.pack_into("Q", self._buf, offset, value)
+
+    def _slot(self, counter: int) -> int:
+        return self._HEADER_SIZE + (counter % self.capacity) * self._record.size
+
+    def _unpack(self, counter: int):
+        item = self._record.unpack_from(self._buf, self._slot(counter))
+        return item[0] if len(item) == 1 else item
+
+    def _pack(self, counter: int, item) -> None:
+        if isinstance(item, tuple):
+            self._record.pack_into(self._buf, self._slot(counter), *item)
+        else:
+            self._record.pack_into(self._buf, self._slot(counter), item)
+
+    def enqueue(self, item) -> None:
+        """Add item to the end of the queue. Raises IndexError if full. O(1)"""
+        if not self.enqueue_many((item,)):
+            raise IndexError("enqueue to full queue")
+
+    def enqueue_many(self, items: Iterable) -> int:
+        """
+        Add items to the end of the queue until it is full, publishing them
+        all at once. Returns how many were added; items left over in an
+        iterator are not consumed. O(k)
+        """
+        if self._lock is not None:
+            self._lock.acquire()
+        try:
+            tail = self._load(self._TAIL)
+            free = self.capacity - (tail - self._load(self._HEAD))
+            count = 0
+            # islice stops before pulling an item that would not fit, so a
+            # caller can resume from the same iterator.
+            for item in islice(items, free):
+                self._pack(tail + count, item)
+                count += 1
+            if count:
+                self._store(self._TAIL, tail + count)
+            return count
+        finally:
+            if self._lock is not None:
+                self._lock.release()
+
+    def dequeue(self):
+        """Remove and return the front item. Raises IndexError if empty. O(1)"""
+        items = self.dequeue_many(1)
+        if not items:
+            raise IndexError("dequeue from empty queue")
+        return items[0]
+
+    def dequeue_many(self, max_items: int) -> List:
+        """
+        Remove and return up to max_items front items, oldest first.
+        Raises ValueError if max_items is negative. O(k)
+        """
+        if max_items < 0:
+            raise ValueError("max_items must not be negative")
+        head = self._load(self._HEAD)
+        count = min(max_items, self._load(self._TAIL) - head)
+        items = [self._unpack(head + i) for i in range(count)]
+        if count:
+            self._store(self._HEAD, head + count)
+        return items
+
+    def peek(self):
+        """Return front item without removing it, or None if empty. O(1)"""
+        head = self._load(self._HEAD)
+        if head == self._load(self._TAIL):
+            return None
+        return self._unpack(head)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the queue is not empty or timeout seconds pass.
+        Returns True if items are available. Polls with a backoff capped
+        at 1 ms.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.00001
+        while self.is_empty():
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.001)
+        return True
+
+    def is_empty(self) -> bool:
+        return self._load(self._HEAD) == self._load(self._TAIL)
+
+    def __len__(self) -> int:
+        return self._load(self._TAIL) - self._load(self._HEAD)
+
+    def close(self) -> None:
+        """Detach this process from the shared memory."""
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Free the shared memory. Call once, from the creating process."""
+        self._shm.unlink()
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _stable_hash(item: Hashable) -> int:
+    """
+    hash() for numbers, which is the same in every process. str and bytes
+    hashes are salted per process, so they use a blake2b digest instead;
+    tuples combine their elements' stable hashes. Other types fall back to
+    hash(), which may differ between processes.
+    """
+    kind = type(item)
+    if kind is int or kind is float:
+        return hash(item)
+    if kind is str:
+        item = item.encode("utf-8", "surrogatepass")
+        kind = bytes
+    if kind is bytes:
+        return int.from_bytes(blake2b(item, digest_size=8).digest(), "little")
+    if kind is tuple:
+        h = 0xCBF29CE484222325
+        for element in item:
+            h = ((h ^ _stable_hash(element)) * 0x100000001B3) & _MASK64
+        return h ^ len(item)
+    return hash(item)
+
+
+def _hash_pair(item: Hashable):
+    """
+    Two hashes for double hashing, from one multiply-xorshift of
+    _stable_hash() (the identity for small ints). h2 is odd so the k probes
+    h1, h1 + h2, ... do not repeat.
+    """
+    kind = type(item)
+    # Numbers inline the first branch of _stable_hash: it is the hot path.
+    h = hash(item) if kind is int or kind is float else _stable_hash(item)
+    h = (h * 0x9E3779B97F4A7C15) & _MASK64
+    h ^= h >> 29
+    return h, (h >> 32) | 1
+
+
+class BloomFilter:
+    """
+    Probabilistic set of hashable items backed by a bit array. "item in
+    filter" is False only if the item was never added, so a miss can be
+    answered without searching the real data; a hit may be a false
+    positive. Sized for capacity items at false_positive_rate.
+    Items cannot be removed. Worth it in front of LinkedList.find, or a
+    sorted sequence when most lookups miss: hits pay for every probe.
+    Numbers, str, bytes and tuples of them hash the same in every process,
+    so a pickled filter of those stays valid in another interpreter.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.num_bits = max(8, math.ceil(
+            -capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    @classmethod
+    def from_iterable(cls,
+                      items: Iterable[Hashable],
+                      false_positive_rate: float = 0.01,
+                      capacity: Optional[int] = None) -> "BloomFilter":
+        """Build a filter holding items, sized for capacity (default: len(items))."""
+        items = list(items)
+        bloom = cls(capacity or max(len(items), 1), false_positive_rate)
+        bloom.add_many(items)
+        return bloom
+
+    def add(self, item: Hashable) -> None:
+        """Add item. O(k), k = num_hashes."""
+        bits = self._bits
+        num_bits = self.num_bits
+        position, step = _hash_pair(item)
+        for _ in range(self.num_hashes):
+            bit = position % num_bits
+            bits[bit >> 3] |= 1 << (bit & 7)
+            position += step
+        self._count += 1
+
+    def add_many(self, items: Iterable[Hashable]) -> None:
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: Hashable) -> bool:
+        """
+        False if item was definitely never added. O(k), and a miss usually
+        stops at the first or second probe.
+        """
+        bits = self._bits
+        num_bits = self.num_bits
+        position, step = _hash_pair(item)
+        for _ in range(self.num_hashes):
+            bit = position % num_bits
+            if not bits[bit >> 3] >> (bit & 7) & 1:
+                return False
+            position += step
+        return True
+
+    def __len__(self) -> int:
+        """Number of add() calls, duplicates included."""
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the bit array in bytes."""
+        return len(self._bits)
+
+    def estimated_false_positive_rate(self) -> float:
+        """Expected false positive rate for the items added so far."""
+        return (1 - math.exp(-self.num_hashes * self._count / self.num_bits)) ** self.num_hashes
+
+    def __repr__(self) -> str:
+        return (f"BloomFilter(capacity={self.capacity}, "
+                f"false_positive_rate={self.false_positive_rate}, "
+                f"items={self._count}, nbytes={self.nbytes})")
+
+
 class LinkedListNode(Generic[T]):
     def __init__(self, value: T, next: Optional["LinkedListNode[T]"] = None) -> None:
         self.value = value
@@ -105,6 +566,7 @@ class LinkedList(ABC, Generic[T]):
         self.head: Optional[LinkedListNode[T]] = None
         self.tail: Optional[LinkedListNode[T]] = None
         self._size = 0
+        self._filter: Optional[BloomFilter] = None
 
     @abstractmethod
     def insert_first(self, value: T) -> None:
@@ -136,13 +598,59 @@ class LinkedList(ABC, Generic[T]):
         """Remove and return the last node, or None if empty."""
         pass
 
+    def attach_filter(self,
+                      false_positive_rate: float = 0.01,
+                      capacity: Optional[int] = None) -> BloomFilter:
+        """
+        Build a BloomFilter over the current values and keep it updated on
+        insertion, so find and delete answer most misses in O(1) instead of
+        walking the list. Values must be hashable. The filter is rebuilt
+        with twice the capacity when it fills up. Returns the filter. O(n).
+        """
+        capacity = max(capacity or 2 * self._size, self._size, 64)
+        self._filter = BloomFilter.from_iterable(self, false_positive_rate, capacity)
+        return self._filter
+
+    def detach_filter(self) -> None:
+        self._filter = None
+
+    def __getstate__(self):
+        # A filter of values without a stable hash would give false
+        # negatives in another process, so only its settings are kept.
+        state = self.__dict__.copy()
+        bloom = state.pop("_filter")
+        state["_filter_rate"] = None if bloom is None else bloom.false_positive_rate
+        return state
+
+    def __setstate__(self, state) -> None:
+        rate = state.pop("_filter_rate")
+        self.__dict__.update(state)
+        self._filter = None
+        if rate is not None:
+            self.attach_filter(rate)
+
+    def _track(self, value: T) -> None:
+        """Record an inserted value in the attached filter, if any."""
+        bloom = self._filter
+        if bloom is None:
+            return
+        if len(bloom) >= bloom.capacity:
+            # Rebuilding also drops values deleted since the last build.
+            self.attach_filter(bloom.false_positive_rate, 2 * bloom.capacity)
+        else:
+            bloom.add(value)
+
     def _find_node_and_prev(
             self,
             value: T) -> PreviousAndCurrent[T]:
         """
         Traverses the list, returning the (previous node, current node)
-        when the value is found, or (None, None) otherwise. O(n).
+        when the value is found, or (None, None) otherwise. O(n), or O(1)
+        when an attached filter rules the value out.
         """
+        if self._filter is not None and value not in self._filter:
+            return PreviousAndCurrent(None, None)
+
         prev = None
         cur = self.head
         while cur:
@@ -171,10 +679,147 @@ class LinkedList(ABC, Generic[T]):
             self.head = cur.next
         else:
             prev.next = cur.next
+        if cur.next is None:
+            self._update_tail(prev)
 
         self._size -= 1
         return True
 
+    def _update_tail(self, node: Optional[LinkedListNode[T]]) -> None:
+        """Hook called when the last node changes. Lists without tail ignore it."""
+        pass
+
+    @classmethod
+    def from_iterable(cls: Type[L], values: Iterable[T]) -> L:
+        """Build a list holding values in order. O(n)."""
+        linked_list = cls()
+        linked_list.extend(values)
+        return linked_list
+
+    def extend(self, values: Iterable[T]) -> None:
+        """
+        Append values at the end of the list, in order. Finds the last node
+        once, so it costs O(n + k) even without a tail pointer.
+        """
+        if values is self:
+            # Iterating the live chain while appending to it never ends.
+            values = list(values)
+        last = self.get_last_node()
+        count = 0
+        for value in values:
+            node = LinkedListNode(value)
+            if last is None:
+                self.head = node
+            else:
+                last.next = node
+            last = node
+            count += 1
+            self._track(value)
+        if count:
+            self._size += count
+            self._update_tail(last)
+
+    def remove_if(self, predicate: Callable[[T], bool]) -> int:
+        """
+        Delete every node whose value matches predicate in a single pass.
+        Returns the number of nodes removed. O(n).
+        """
+        removed = 0
+        prev = None
+        cur = self.head
+        while cur:
+            if predicate(cur.value):
+                if prev is None:
+                    self.head = cur.next
+                else:
+                    prev.next = cur.next
+                removed += 1
+            else:
+                prev = cur
+            cur = cur.next
+        self._size -= removed
+        self._update_tail(prev)
+        return removed
+
+    def reverse(self) -> None:
+        """Reverse the list in place by relinking nodes. O(n)."""
+        first = self.head
+        prev = None
+        cur = self.head
+        while cur:
+            cur.next, prev, cur = prev, cur, cur.next
+        self.head = prev
+        self._update_tail(first)
+
+    def sort(self) -> None:
+        """
+        Sort the list in place with a bottom-up mergesort that only relinks
+        existing nodes. Stable.
+        Time Complexity: O(n log n)
+        Space Complexity: O(1)
+        """
+        head = self.head
+        tail = head
+        size = 1
+        while size < self._size:
+            new_head = new_tail = None
+            cur = head
+            while cur:
+                left = cur
+                right = self._split(left, size)
+                cur = self._split(right, size)
+                merged_head, merged_tail = self._merge(left, right)
+                if new_tail is None:
+                    new_head = merged_head
+                else:
+                    new_tail.next = merged_head
+                new_tail = merged_tail
+            head, tail = new_head, new_tail
+            size *= 2
+        self.head = head
+        self._update_tail(tail)
+
+    @staticmethod
+    def _split(
+            node: Optional[LinkedListNode[T]],
+            count: int) -> Optional[LinkedListNode[T]]:
+        """Cut the chain after count nodes and return the rest. O(count)."""
+        for _ in range(count - 1):
+            if node is None:
+                break
+            node = node.next
+        if node is None:
+            return None
+        rest = node.next
+        node.next = None
+        return rest
+
+    @staticmethod
+    def _merge(
+            left: Optional[LinkedListNode[T]],
+            right: Optional[LinkedListNode[T]]
+    ) -> Tuple[Optional[LinkedListNode[T]], Optional[LinkedListNode[T]]]:
+        """Merge two sorted chains, returning the (head, tail) of the result."""
+        head = tail = None
+        while left and right:
+            if left.value <= right.value:
+                node, left = left, left.next
+            else:
+                node, right = right, right.next
+            if tail is None:
+                head = node
+            else:
+                tail.next = node
+            tail = node
+        rest = left or right
+        if tail is None:
+            head = tail = rest
+        else:
+            tail.next = rest
+        while tail is not None and tail.next is not None:
+            tail = tail.next
+        return head, tail
+
     def __len__(self) -> int:
         return self._size
 
@@ -196,6 +841,7 @@ class SimpleLinkedList(LinkedList[T]):
         node = LinkedListNode(value, self.head)
         self.head = node
         self._size += 1
+        self._track(value)
     
     def get_first(self) -> Optional[LinkedListNode[T]]:
         """Returns the first node in the list. O(1)."""
@@ -220,6 +866,7 @@ class SimpleLinkedList(LinkedList[T]):
         else:
             cur.next = node
         self._size += 1
+        self._track(value)
 
     def pop(self) -> Optional[LinkedListNode[T]]:
         """Remove and return the first node, or None if empty. O(1)"""
@@ -254,6 +901,9 @@ class SimpleLinkedList(LinkedList[T]):
 class TailedLinkedList(LinkedList[T]):
     """Singly linked list with head and tail."""
 
+    def _update_tail(self, node: Optional[LinkedListNode[T]]) -> None:
+        self.tail = node
+
     def insert_first(self, value: T) -> None:
         """Insert value at the beginning of the list. O(1)."""
         node = LinkedListNode(value, self.head)
@@ -261,6 +911,7 @@ class TailedLinkedList(LinkedList[T]):
         if self.tail is None:
             self.tail = node
         self._size += 1
+        self._track(value)
     
     def get_first(self) -> Optional[LinkedListNode[T]]:
         """Returns the first node in the list. O(1)."""
@@ -272,13 +923,14 @@ class TailedLinkedList(LinkedList[T]):
 
     def insert_last(self, value: T) -> None:
         """Insert value at the end of the list. O(1)."""
-        node = LinkedListNode(value, self.head)
+        node = LinkedListNode(value)
         if self.head is None:
             self.insert_first(value)
         else:
             self.tail.next = node
             self.tail = node
             self._size += 1
+            self._track(value)
 
     def pop(self) -> Optional[LinkedListNode[T]]:
         """Remove and return the first node, or None if empty. O(1)"""
@@ -315,3 +967,126 @@ class TailedLinkedList(LinkedList[T]):
         self.tail = cur
         self._size -= 1
         return node_to_pop
+
+
+def dump_sorted(values: Iterable[int], path: str, typecode: str = "q") -> int:
+    """
+    Write sorted integers to path as packed fixed-width binary records,
+    readable by MappedSortedArray. Raises ValueError if values are not sorted.
+    The file is written next to path and moved into place only on success,
+    so a failed dump never leaves a truncated file behind.
+    Returns the number of records written.
+    Time Complexity: O(n)
+    Space Complexity: O(1) (values are streamed in fixed-size chunks)
+    """
+    chunk_size = 1 << 16
+    count = 0
+    previous: Optional[int] = None
+    chunk = array(typecode)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for value in values:
+                if previous is not None and value < previous:
+                    raise ValueError("values must be sorted in ascending order")
+                previous = value
+                chunk.append(value)
+                if len(chunk) == chunk_size:
+                    chunk.tofile(f)
+                    count += len(chunk)
+                    chunk = array(typecode)
+            chunk.tofile(f)
+            count += len(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return count
+
+
+class MappedSortedArray(Sequence[int]):
+    """
+    Read-only sorted integer sequence backed by a memory-mapped file written
+    with dump_sorted. Nothing is loaded up front: elements are read through a
+    zero-copy memoryview, pages are faulted in on demand and shared between
+    every process mapping the same file. Works with binary_search.
+    """
+
+    def __init__(self, path: str, typecode: str = "q") -> None:
+        self.path = path
+        self.typecode = typecode
+        self._file = open(path, "rb")
+        self._mm: Optional[mmap.mmap] = None
+        try:
+            itemsize = array(typecode).itemsize
+            size = os.fstat(self._file.fileno()).st_size
+            if size % itemsize:
+                raise ValueError(
+                    f"file size {size} is not a multiple of item size {itemsize}")
+            if size == 0:
+                # mmap refuses empty files
+                self._view = memoryview(b"").cast(typecode)
+            else:
+                self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._view = memoryview(self._mm).cast(typecode)
+        except BaseException:
+            self._file.close()
+            raise
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __getitem__(self, index: Union[int, slice]):
+        """Return the element at index, or a zero-copy view for a slice. O(1)"""
+        return self._view[index]
+
+    # Sequence's versions scan every element; the data is sorted, so bisect.
+    def __contains__(self, value) -> bool:
+        """O(log n)"""
+        view = self._view
+        i = bisect_left(view, value)
+        return i < len(view) and view[i] == value
+
+    def index(self, value, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Return the first index of value in [start, stop). Raises ValueError
+        if it is not present. O(log n)
+        """
+        n = len(self._view)
+        if start < 0:
+            start = max(n + start, 0)
+        if stop is None:
+            stop = n
+        elif stop < 0:
+            stop += n
+        stop = min(stop, n)
+        i = bisect_left(self._view, value, start, max(start, stop))
+        if i < stop and self._view[i] == value:
+            return i
+        raise ValueError(f"{value!r} is not in MappedSortedArray")
+
+    def count(self, value) -> int:
+        """O(log n)"""
+        return bisect_right(self._view, value) - bisect_left(self._view, value)
+
+    def close(self) -> None:
+        """Unmap the file. Views returned by slicing must be released first."""
+        self._view.release()
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self) -> "MappedSortedArray":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __reduce__(self):
+        # Worker processes re-map the file instead of pickling its contents.
+        return (MappedSortedArray, (self.path, self.typecode))
+
+    def __repr__(self) -> str:
+        return f"MappedSortedArray({self.path!r}, {self.typecode!r}, len={len(self)})"
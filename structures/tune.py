@@ -0,0 +1,102 @@
+"""
+Machine-calibrated choice between algorithm variants.
+
+Run ``python -m structures.tune`` to benchmark the sort and search variants
+on this machine and save which one wins at each input size. The sort() and
+search() front doors in structures.dispatch read that profile.
+"""
+
+from __future__ import annotations
+
+# random, timeit and argparse are only needed to calibrate; they are
+# imported there so importing the package stays fast.
+import json
+import os
+from typing import Callable, Dict, List, Optional, Sequence
+
+from . import dispatch
+from .dispatch import SEARCHES, SORTS, Profile, profile_path
+
+DEFAULT_SIZES = [8, 64, 512, 4096]
+
+
+def _fastest(candidates: Dict[str, Callable[[], object]], repeat: int) -> str:
+    import timeit
+
+    timings = {
+        name: min(timeit.repeat(run, number=1, repeat=repeat))
+        for name, run in candidates.items()
+    }
+    return min(timings, key=timings.__getitem__)
+
+
+def _time_sorts(inputs: List[List[int]], repeat: int) -> str:
+    """Fastest sort over all inputs together, so a bad worst case counts."""
+    return _fastest(
+        {name: (lambda fn=fn: [fn(data) for data in inputs]) for name, fn in SORTS.items()},
+        repeat)
+
+
+def _compress(winners: List[List]) -> List[List]:
+    """Merge adjacent sizes won by the same variant into one row."""
+    rows: List[List] = []
+    for size, name in winners:
+        if rows and rows[-1][1] == name:
+            rows[-1][0] = size
+        else:
+            rows.append([size, name])
+    return rows
+
+
+def calibrate(sizes: Sequence[int] = DEFAULT_SIZES, repeat: int = 5) -> Profile:
+    """Benchmark every sort and search variant at each size. Returns a profile."""
+    import random
+
+    rng = random.Random(0)
+    sort_winners = []
+    search_winners = []
+    for size in sorted(sizes):
+        data = [rng.randrange(size * 4) for _ in range(size)]
+        ordered = sorted(data)
+        # Already sorted input is common and is quicksort_in_place's worst case.
+        sort_winners.append([size, _time_sorts([data, ordered], repeat)])
+
+        targets = [rng.randrange(size * 4) for _ in range(256)]
+        search_winners.append([size, _fastest(
+            {name: (lambda fn=fn: [fn(ordered, t) for t in targets])
+             for name, fn in SEARCHES.items()},
+            repeat)])
+    return {"sort": _compress(sort_winners), "search": _compress(search_winners)}
+
+
+def save_profile(profile: Profile, path: Optional[str] = None) -> str:
+    """Write profile as JSON, creating its directory. Returns the path used."""
+    path = path or profile_path()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(profile, f, indent=2)
+    # Let the front doors pick up the new profile on their next call.
+    dispatch._profile = None
+    return path
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m structures.tune",
+        description="Benchmark algorithm variants and save the fastest per input size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="profile path (default: %(default)s)",
+                        default=profile_path())
+    args = parser.parse_args(argv)
+
+    profile = calibrate(args.sizes, args.repeat)
+    path = save_profile(profile, args.output)
+    print(json.dumps(profile, indent=2))
+    print(f"saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
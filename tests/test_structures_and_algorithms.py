@@ -1,18 +1,38 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+
 import pytest
 
-from structures.models import Stack, Queue, SimpleLinkedList, TailedLinkedList
+from structures.models import (
+    Stack,
+    Queue,
+    MonotonicQueue,
+    SlidingWindow,
+    SharedRingQueue,
+    SimpleLinkedList,
+    TailedLinkedList,
+    MappedSortedArray,
+    dump_sorted,
+    BloomFilter,
+)
 from structures.algorithms import (
     binary_search,
     binary_search_recursive,
+    binary_search_many,
     quicksort,
     quicksort_in_place,
     mergesort,
     mergesort_in_place,
+    merge_into_sorted,
+    remove_from_sorted,
     factorial_recursive,
     factorial_iterative,
     fibonacci_recursive,
     fibonacci_iterative,
 )
+from structures import dispatch, tune
 
 
 def test_stack():
@@ -55,6 +75,155 @@ def test_queue():
     with pytest.raises(IndexError):
         q.dequeue()
 
+def test_monotonic_queue():
+    # Empty queue
+    q = MonotonicQueue()
+    assert q.extreme() is None
+    with pytest.raises(IndexError):
+        q.dequeue()
+    with pytest.raises(ValueError):
+        MonotonicQueue("median")
+    # Max, with duplicates
+    q = MonotonicQueue[int]("max")
+    for item in [3, 1, 3, 2]:
+        q.enqueue(item)
+    assert q.extreme() == 3
+    assert q.dequeue() == 3
+    assert q.extreme() == 3
+    assert q.dequeue() == 1
+    assert q.dequeue() == 3
+    assert q.extreme() == 2
+    # Min
+    q = MonotonicQueue[int]("min")
+    for item in [3, 1, 2]:
+        q.enqueue(item)
+    assert q.peek() == 3
+    assert q.extreme() == 1
+
+def test_sliding_window():
+    # Empty and invalid
+    assert SlidingWindow(3, max).value() is None
+    with pytest.raises(ValueError):
+        SlidingWindow(0)
+    with pytest.raises(ValueError):
+        SlidingWindow(3, "median")
+    # Generator mode
+    data = [5, 3, 8, 1, 2, 9, 5]
+    assert list(SlidingWindow(3, "min").slide(data)) == [3, 1, 1, 1, 2]
+    assert list(SlidingWindow(3, max).slide(data)) == [8, 8, 8, 9, 9]
+    assert list(SlidingWindow(3, sum).slide(data)) == [16, 12, 11, 12, 16]
+    assert list(SlidingWindow(2, "mean").slide([1, 2, 4])) == [1.5, 3.0]
+    # Partial window
+    w = SlidingWindow(3, "sum")
+    w.push(4)
+    assert w.value() == 4
+    # Batches
+    w.push_many([1, 2])
+    assert w.value() == 7
+    w.push_many(range(100))
+    assert len(w) == 3
+    assert w.value() == 97 + 98 + 99
+    # Large floats leaving the window do not wipe out small ones
+    w = SlidingWindow(2, "sum")
+    w.push_many([1e16, 1.0])
+    w.push(1.0)
+    assert w.value() == 2.0
+    assert list(SlidingWindow(2, "mean").slide([1e16, 1.0, 1.0])) == [5e15, 1.0]
+    # Infinities only affect the windows holding them
+    inf = float("inf")
+    assert list(SlidingWindow(2, "mean").slide([1.0, inf, 3.0, 5.0, 7.0])) == [inf, inf, 4.0, 6.0]
+    assert list(SlidingWindow(2, "sum").slide([inf, 1.0, -inf, 2.0, 3.0])) == [inf, -inf, -inf, 5.0]
+    # NaN only affects the windows holding it
+    nan = float("nan")
+    maxima = list(SlidingWindow(2, "max").slide([1.0, nan, 3.0, 5.0, 7.0]))
+    assert maxima[0] == 1.0 and maxima[1] != maxima[1] and maxima[2:] == [5.0, 7.0]
+    minima = list(SlidingWindow(2, min).slide([nan, 1.0, 3.0, 2.0]))
+    assert minima[0] != minima[0] and minima[1:] == [1.0, 2.0]
+    # Large ints stay exact
+    assert list(SlidingWindow(2, "sum").slide([10 ** 400, 1, 2])) == [10 ** 400 + 1, 3]
+
+def _produce(queue, start, count):
+    i = start
+    while i < start + count:
+        i += queue.enqueue_many(range(i, start + count))
+
+def test_shared_ring_queue():
+    # Empty queue
+    q = SharedRingQueue(2)
+    try:
+        with pytest.raises(IndexError):
+            q.dequeue()
+        assert q.peek() is None
+        assert q.dequeue_many(5) == []
+        assert not q.wait(timeout=0.01)
+        # Normal operations
+        assert q.is_empty()
+        q.enqueue(1)
+        q.enqueue(2)
+        assert len(q) == 2
+        with pytest.raises(IndexError):
+            q.enqueue(3)
+        assert q.peek() == 1
+        assert q.dequeue() == 1
+        # Wraps around
+        assert q.enqueue_many([3, 4, 5]) == 1
+        assert q.wait(timeout=0.01)
+        assert q.dequeue_many(5) == [2, 3]
+        assert q.is_empty()
+        # Invalid batch sizes never move the head
+        q.enqueue(6)
+        assert q.dequeue_many(0) == []
+        with pytest.raises(ValueError):
+            q.dequeue_many(-1)
+        assert q.dequeue() == 6
+        with pytest.raises(ValueError):
+            q.dequeue_many(-1)
+        assert q.is_empty()
+    finally:
+        q.close()
+        q.unlink()
+    # Iterators keep the items that did not fit
+    q = SharedRingQueue(2)
+    try:
+        items = iter([1, 2, 3, 4])
+        assert q.enqueue_many(items) == 2
+        assert q.enqueue_many(items) == 0
+        assert q.dequeue() == 1
+        assert q.enqueue_many(items) == 1
+        assert next(items) == 4
+        assert q.dequeue_many(5) == [2, 3]
+    finally:
+        q.close()
+        q.unlink()
+    # Bytes records
+    q = SharedRingQueue(4, format="4s")
+    try:
+        q.enqueue(b"ab")
+        assert q.dequeue() == b"ab\x00\x00"
+    finally:
+        q.close()
+        q.unlink()
+    # Between processes
+    q = SharedRingQueue(16, multi_producer=True)
+    workers = [
+        multiprocessing.Process(target=_produce, args=(q, start, 500))
+        for start in (0, 1000)
+    ]
+    try:
+        for worker in workers:
+            worker.start()
+        received = []
+        while len(received) < 1000:
+            assert q.wait(timeout=10)
+            received.extend(q.dequeue_many(8))
+        for worker in workers:
+            worker.join()
+        assert [x for x in received if x < 1000] == list(range(500))
+        assert [x for x in received if x >= 1000] == list(range(1000, 1500))
+    finally:
+        q.close()
+        q.unlink()
+
 def test_simple_linked():
     # Empty list
     ll = SimpleLinkedList[int]()
@@ -95,6 +264,120 @@ def test_tailed_linked():
     assert list(ll) == [0, 2]
     assert ll.delete(99) is False
 
+@pytest.mark.parametrize("cls", [SimpleLinkedList, TailedLinkedList])
+def test_linked_bulk_operations(cls):
+    # Empty
+    ll = cls.from_iterable([])
+    assert len(ll) == 0
+    ll.sort()
+    ll.reverse()
+    assert ll.remove_if(lambda x: True) == 0
+    assert list(ll) == []
+    # Build and extend
+    ll = cls.from_iterable(iter([5, 3, 8]))
+    ll.extend([1, 2, 9, 5])
+    assert list(ll) == [5, 3, 8, 1, 2, 9, 5]
+    assert len(ll) == 7
+    # Sort relinks the existing nodes
+    nodes = set()
+    node = ll.get_first()
+    while node:
+        nodes.add(id(node))
+        node = node.next
+    ll.sort()
+    assert list(ll) == [1, 2, 3, 5, 5, 8, 9]
+    node = ll.get_first()
+    while node:
+        assert id(node) in nodes
+        node = node.next
+    # Reverse
+    ll.reverse()
+    assert list(ll) == [9, 8, 5, 5, 3, 2, 1]
+    # Remove if
+    assert ll.remove_if(lambda x: x % 2 == 1) == 5
+    assert list(ll) == [8, 2]
+    assert len(ll) == 2
+    # Still usable at the end after relinking
+    ll.insert_last(4)
+    assert list(ll) == [8, 2, 4]
+    assert ll.get_last_node().value == 4
+    # Extending with itself doubles the list once
+    ll.extend(ll)
+    assert list(ll) == [8, 2, 4, 8, 2, 4]
+    assert len(ll) == 6
+    assert ll.get_last_node().value == 4
+
+def test_bloom_filter():
+    # Invalid
+    with pytest.raises(ValueError):
+        BloomFilter(0)
+    with pytest.raises(ValueError):
+        BloomFilter(10, false_positive_rate=1)
+    # No false negatives, false positives near the configured rate
+    bloom = BloomFilter.from_iterable(range(0, 20000, 2), false_positive_rate=0.01)
+    assert len(bloom) == 10000
+    assert all(i in bloom for i in range(0, 20000, 2))
+    false_positives = sum(i in bloom for i in range(1, 20000, 2))
+    assert false_positives < 300
+    assert 0 < bloom.estimated_false_positive_rate() < 0.02
+    # Memory: about 9.6 bits per item at 1%
+    assert 11000 < bloom.nbytes < 13000
+    # Other hashable values
+    words = BloomFilter.from_iterable(["a", "b", (1, 2)])
+    assert "a" in words and (1, 2) in words
+
+_PICKLE_FILTERS = """
+import pickle, sys
+from structures.models import BloomFilter, SimpleLinkedList, TailedLinkedList
+words = ["apple", "pear", "fig", b"kiwi", ("plum", 3), 7, 2.5]
+if sys.argv[1] == "dump":
+    ll = TailedLinkedList.from_iterable(words)
+    ll.attach_filter()
+    with open(sys.argv[2], "wb") as f:
+        pickle.dump((BloomFilter.from_iterable(words), ll), f)
+else:
+    with open(sys.argv[2], "rb") as f:
+        bloom, ll = pickle.load(f)
+    assert all(word in bloom for word in words)
+    assert all(ll.find(word) is not None for word in words)
+    assert ll._filter is not None
+    ll.insert_last("grape")
+    assert ll.find("grape") is not None
+"""
+
+def test_bloom_filter_across_processes(tmp_path):
+    # String hashes are salted per process; filters must not depend on them.
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = str(tmp_path / "filters.pickle")
+    for mode, seed in (("dump", "1"), ("load", "2")):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        result = subprocess.run(
+            [sys.executable, "-c", _PICKLE_FILTERS, mode, path],
+            cwd=root, env=env, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+@pytest.mark.parametrize("cls", [SimpleLinkedList, TailedLinkedList])
+def test_linked_filter(cls):
+    ll = cls.from_iterable(range(10))
+    bloom = ll.attach_filter()
+    assert ll.find(5) is not None
+    assert ll.find(99) is None
+    # Kept in sync on insertion, and rebuilt when full
+    ll.insert_first(-1)
+    ll.insert_last(100)
+    ll.extend(range(200, 400))
+    assert ll.find(-1) is not None
+    assert ll.find(100) is not None
+    assert all(ll.find(i) is not None for i in range(200, 400))
+    assert ll._filter is not bloom
+    assert ll._filter.capacity >= len(ll)
+    # Deletions still work
+    assert ll.delete(5) is True
+    assert ll.find(5) is None
+    assert ll.delete(5) is False
+    ll.detach_filter()
+    assert ll.find(6) is not None
+
 def test_binary_search():
     # Empty
     assert binary_search([], 1) == -1
@@ -111,6 +394,11 @@ def test_binary_search():
     arr = [1, 3, 4, 7, 9, 10]
     assert binary_search(arr, 7) == 3
     assert binary_search(arr, 2) == -1
+    # With a membership filter
+    bloom = BloomFilter.from_iterable(arr)
+    assert binary_search(arr, 7, bloom) == 3
+    assert binary_search(arr, 2, bloom) == -1
+    assert binary_search(arr, 2, membership=set(arr)) == -1
 
 def test_binary_search_recursive():
     # Empty
@@ -129,6 +417,65 @@ def test_binary_search_recursive():
     assert binary_search_recursive(arr, 7) == 3
     assert binary_search_recursive(arr, 2) == -1
 
+def test_binary_search_many():
+    # Empty
+    assert binary_search_many([], [1, 2]) == [-1, -1]
+    assert binary_search_many([1, 2], []) == []
+    # Unordered targets keep their order in the result
+    arr = [1, 3, 4, 7, 9, 10]
+    assert binary_search_many(arr, [9, 2, 1, 10, 7]) == [4, -1, 0, 5, 3]
+    # Repeated targets
+    assert binary_search_many(arr, [4, 4]) == [2, 2]
+    # With a membership filter
+    assert binary_search_many(arr, [9, 2, 1], membership=set(arr)) == [4, -1, 0]
+
+def test_mapped_sorted_array(tmp_path):
+    # Empty file
+    path = str(tmp_path / "empty.bin")
+    assert dump_sorted([], path) == 0
+    with MappedSortedArray(path) as arr:
+        assert len(arr) == 0
+        assert binary_search(arr, 1) == -1
+    # Round trip
+    path = str(tmp_path / "table.bin")
+    values = [-5, -2, 0, 3, 7, 7, 100]
+    assert dump_sorted(iter(values), path) == len(values)
+    with MappedSortedArray(path) as arr:
+        assert len(arr) == len(values)
+        assert list(arr) == values
+        assert arr[-1] == 100
+        assert binary_search(arr, -2) == 1
+        assert binary_search_recursive(arr, 3) == 3
+        assert binary_search(arr, 4) == -1
+        assert binary_search_many(arr, [100, 1, -5]) == [6, -1, 0]
+        assert 7 in arr
+        assert 4 not in arr
+        assert 101 not in arr
+        assert arr.index(7) == 4
+        assert arr.index(7, 5) == 5
+        assert arr.index(-5, -7) == 0
+        with pytest.raises(ValueError):
+            arr.index(4)
+        with pytest.raises(ValueError):
+            arr.index(7, 0, 4)
+        assert arr.count(7) == 2
+        assert arr.count(4) == 0
+    # Failed dumps leave no file behind and keep an existing one intact
+    with pytest.raises(ValueError):
+        dump_sorted([2, 1], str(tmp_path / "bad.bin"))
+    with pytest.raises(OverflowError):
+        dump_sorted([1, 2 ** 70], str(tmp_path / "big.bin"))
+    with pytest.raises(ValueError):
+        dump_sorted([5, 1], path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["empty.bin", "table.bin"]
+    with MappedSortedArray(path) as arr:
+        assert list(arr) == values
+    # Truncated file
+    bad = tmp_path / "truncated.bin"
+    bad.write_bytes(b"\x00" * 3)
+    with pytest.raises(ValueError):
+        MappedSortedArray(str(bad))
+
 def test_quicksort():
     # Emtpy
     assert quicksort([]) == []
@@ -145,6 +492,9 @@ def test_quicksort():
     # Mixed
     unsorted = [5, 3, 8, 1, 2, 9, 5]
     assert quicksort(unsorted) == sorted(unsorted)
+    assert unsorted == [5, 3, 8, 1, 2, 9, 5]
+    # Large sorted input stays within the recursion limit
+    assert quicksort(range(5000)) == list(range(5000))
     # Invalid type
     with pytest.raises(TypeError):
         quicksort(None)
@@ -195,6 +545,9 @@ def test_mergesort():
     # Mixed
     unsorted = [5, 3, 8, 1, 2, 9, 5]
     assert mergesort(unsorted) == sorted(unsorted)
+    assert unsorted == [5, 3, 8, 1, 2, 9, 5]
+    # Tuples
+    assert mergesort((3, 1, 2)) == [1, 2, 3]
     # Invalid type
     with pytest.raises(TypeError):
         mergesort(None)
@@ -229,6 +582,93 @@ def test_mergesort_in_place():
     mergesort_in_place(arr)
     assert arr == sorted([5, 3, 8, 1, 2, 9, 5])
 
+def test_merge_into_sorted():
+    # Empty base and empty delta
+    assert merge_into_sorted([], []) == []
+    assert merge_into_sorted([], [3, 1, 2]) == [1, 2, 3]
+    assert merge_into_sorted([1, 2], []) == [1, 2]
+    # In place
+    base = [1, 3, 5, 7]
+    result = merge_into_sorted(base, [6, 0, 8, 3])
+    assert result is base
+    assert base == [0, 1, 3, 3, 5, 6, 7, 8]
+    # Copying leaves the base untouched
+    base = [1, 3, 5, 7]
+    assert merge_into_sorted(base, iter([4, 4, -1]), in_place=False) == [-1, 1, 3, 4, 4, 5, 7]
+    assert base == [1, 3, 5, 7]
+    # Mixed
+    base = sorted([5, 3, 8, 1, 2, 9, 5])
+    delta = [7, 2, 10, 0, 5]
+    assert merge_into_sorted(base, delta) == sorted([5, 3, 8, 1, 2, 9, 5] + delta)
+
+def test_remove_from_sorted():
+    # Empty
+    assert remove_from_sorted([], [1]) == []
+    assert remove_from_sorted([1, 2], []) == [1, 2]
+    # In place, one occurrence per item, missing items ignored
+    base = [1, 2, 2, 2, 3, 5, 8]
+    result = remove_from_sorted(base, [8, 2, 4, 1, 2])
+    assert result is base
+    assert base == [2, 3, 5]
+    # Copying leaves the base untouched
+    base = [1, 2, 3]
+    assert remove_from_sorted(base, [3, 1, 2], in_place=False) == []
+    assert base == [1, 2, 3]
+
+def test_tune(tmp_path, monkeypatch):
+    monkeypatch.setattr(dispatch, "_profile", None)
+    # Missing or invalid profile falls back to the defaults
+    assert dispatch.load_profile(str(tmp_path / "missing.json")) == dispatch.DEFAULT_PROFILE
+    bad = tmp_path / "bad.json"
+    search = '[[10, "binary_search"]]'
+    for sort_rows in (
+            '[[10, "bogosort"]]',
+            '[[10]]',
+            '[["x", "quicksort"]]',
+            '[[10, ["a"]]]',
+            '[[true, "quicksort"]]',
+            '[[64, "quicksort"], [8, "mergesort"]]',
+            '[[8, "quicksort"], [8, "mergesort"]]',
+            '[]',
+            '{"10": "quicksort"}'):
+        bad.write_text('{"sort": %s, "search": %s}' % (sort_rows, search))
+        assert dispatch.load_profile(str(bad)) == dispatch.DEFAULT_PROFILE, sort_rows
+    bad.write_text('[1, 2]')
+    assert dispatch.load_profile(str(bad)) == dispatch.DEFAULT_PROFILE
+    good = '{"sort": [[8, "quicksort"], [64, "mergesort"]], "search": %s}' % search
+    bad.write_text(good)
+    assert dispatch.load_profile(str(bad))["sort"] == [[8, "quicksort"], [64, "mergesort"]]
+    # Calibrate, save and dispatch
+    path = str(tmp_path / "profile.json")
+    monkeypatch.setenv("STRUCTURES_PROFILE", path)
+    profile = tune.calibrate(sizes=[4, 32], repeat=1)
+    assert tune.save_profile(profile) == path
+    assert dispatch.load_profile() == profile
+    for kind, variants in (("sort", dispatch.SORTS), ("search", dispatch.SEARCHES)):
+        assert profile[kind][-1][0] == 32
+        assert all(name in variants for _, name in profile[kind])
+    unsorted = [5, 3, 8, 1, 2, 9, 5]
+    assert dispatch.sort(unsorted) == sorted(unsorted)
+    assert unsorted == [5, 3, 8, 1, 2, 9, 5]
+    assert dispatch.sort(list(range(100, 0, -1))) == list(range(1, 101))
+    assert dispatch.search([1, 3, 4, 7, 9, 10], 7) == 3
+    assert dispatch.search([], 7) == -1
+    # Saving drops the profile the front doors cached
+    assert dispatch._profile == profile
+    tune.save_profile(profile)
+    assert dispatch._profile is None
+
+def test_tune_command(tmp_path):
+    path = tmp_path / "profile.json"
+    result = subprocess.run(
+        [sys.executable, "-W", "error::RuntimeWarning", "-m", "structures.tune",
+         "--sizes", "4", "--repeat", "1", "--output", str(path)],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stderr == ""
+    assert dispatch.load_profile(str(path)) != dispatch.DEFAULT_PROFILE
+
 def test_factorial_recursive():
     # Zero and One
     assert factorial_recursive(0) == 1